@@ -1,9 +1,30 @@
-import _ast, ast
+import ast
 import argparse
+import collections
+import concurrent.futures
 import os.path
 import os
+import pickle
+import queue
+import re
+import subprocess
 import sys
-import pydot
+import threading
+import xxhash
+
+# Import names to ignore: Qt classes, all-lowercase/all-uppercase names
+# (functions and constants) and star imports. One compiled regex replaces
+# the startswith/islower/isupper/'*' checks, each of which scanned the name.
+_SKIP_IMPORT = re.compile(r'^(Q.*|\*|[a-z0-9_]+|[A-Z0-9_]+)\Z').match
+
+_CACHE_DIR = '.uml_cache'
+_CACHE_FILE = os.path.join(_CACHE_DIR, 'ast_cache.pkl')
+_CACHE_VERSION = 2
+# bump whenever the shape of the cached summaries changes, so stale
+# caches are discarded instead of fed into the merge
+
+# Per-worker view of the AST cache, set by _init_worker before any parse job runs
+_ast_cache = {}
 
 class DependencyDotGenerator:
     # This class is adopted from https://gist.github.com/hsun/2991630 which I heavily modified
@@ -18,7 +39,7 @@ class DependencyDotGenerator:
 
     def render(self, dependencies, order, relation, imp_relations, output=None):
         """
-        Create input for DOT, and writes into it.
+        Create the DOT source, optionally writing it to a file.
 
         Parameters
         ----------
@@ -26,86 +47,85 @@ class DependencyDotGenerator:
         order: Dictionary of numbered class dependencies.
         relation: Dictionary of relations between classes dependencies.
         imp_relations: Dictionary of import relations between class dependencies.
-        output: Location of output file
+        output: Location of output file, if the .dot file should be kept
 
+        Returns
+        -------
+        The DOT source as a string
         """
 
-        f = open(output, 'w', encoding='utf-8') if output else sys.stdout
+        # build the whole document in memory and write it in one go instead
+        # of issuing one small write per class/edge
+        parts = ['digraph G {\n',
+                 'ranksep=1.0;\n',
+                 'node [style=filled,fontname=Helvetica,fontsize=10];\n']
 
-        f.write('digraph G {\n')
-        f.write('ranksep=1.0;\n')
-        f.write('node [style=filled,fontname=Helvetica,fontsize=10];\n')
+        self.print_classes(parts, dependencies)
+        self.print_relations(parts, relation, order)
+        self.print_imp_relations(parts, imp_relations, order)
 
-        self.print_classes(f, dependencies)
-        self.print_relations(f, relation, order)
-        self.print_imp_relations(f, imp_relations, order)
+        parts.append('}\n')
 
-        f.write('}\n')
-        f.close()
+        dot_source = ''.join(parts)
+        if output:
+            # binary mode with a large buffer: one encode and one write,
+            # no TextIOWrapper layer in between
+            with open(output, 'wb', buffering=1 << 20) as f:
+                f.write(dot_source.encode('utf-8'))
+        return dot_source
 
-    def print_classes(self, f, dependencies):
+    def print_classes(self, parts, dependencies):
         """
         Prints all classes information into the dot file.
 
         Parameters
         ----------
-        f: The Dot file we are writing into
-        dependencies: Dictionary of class dependencies.
+        parts: List of output fragments the dot file is assembled from
+        dependencies: Dictionary of class dependencies, as (number, label) records.
 
         """
         for m, deps in dependencies.items():
-            for d in deps:
-                f.write('%s' % (self.fix(d)))
-                f.write(';\n')
+            for (num, label) in deps:
+                parts.append('"%s" %s;\n' % (num, label))
         return
 
-    def print_relations(self, f, relation, order):
+    def print_relations(self, parts, relation, order):
         """
         Prints all classes relations into the dot file.
 
         Parameters
         ----------
-        f: The Dot file we are writing into
-        dependencies: Dictionary of relations between classes dependencies.
+        parts: List of output fragments the dot file is assembled from
+        relation: Dictionary mapping class number to the name of its base class.
         order: Dictionary of numbered class dependencies.
 
         """
         for give, take in relation.items():
-            if take not in order:
+            take_num = order.get(take)
+            if take_num is None:
                 continue
-            f.write('"{0}" -> "{1}" [arrowhead="empty", arrowtail="none"];\n'.format(order[give], order[take]))
+            parts.append('"{0}" -> "{1}" [arrowhead="empty", arrowtail="none"];\n'.format(give, take_num))
         return
 
-    def print_imp_relations(self, f, relation, order):
+    def print_imp_relations(self, parts, relation, order):
         """
         Prints all import relations into the dot file.
 
         Parameters
         ----------
-        f: The Dot file we are writing into
+        parts: List of output fragments the dot file is assembled from
         relation: Dictionary of import relations between class dependencies..
         order: Dictionary of numbered class dependencies.
 
         """
-        for num, list in relation.items():
-            for item in list:
+        for num, imported in relation.items():
+            # sorted so the emitted edges are deterministic now that the
+            # imports are kept in a set
+            for item in sorted(imported):
                 if item in order:
-                    f.write('"{0}" -> "{1}" [arrowhead="empty", arrowtail="none"];\n'.format(order[item], num))
+                    parts.append('"{0}" -> "{1}" [arrowhead="empty", arrowtail="none"];\n'.format(order[item], num))
         return
 
-    def fix(self, s):
-        """
-        Convert a module name to a syntactically correct node name
-        Parameters
-        ----------
-        s: module name
-
-        Returns
-        -------
-        correct node name
-        """
-        return s.split('.')[-1]
-
 class ImportVisitor(ast.NodeVisitor):
     """
     This class visits AST tree and records all dependent modules from a package.
@@ -144,8 +164,16 @@ class ImportVisitor(ast.NodeVisitor):
         # corrosponds classes to numbers (used for correct .dot file)
 
         self.depgRelation= {}
-        self.verb_list= {}
-        self.import_relation={}
+        self.verb_list= collections.defaultdict(set)
+        self.import_relation= collections.defaultdict(set)
+
+        self._init_attrs = []
+        # stack of attribute sets, one per ClassDef currently being visited
+
+        self._handlers = {node_type: handler.__get__(self)
+                          for node_type, handler in self._DISPATCH.items()}
+        # binding the handlers once per instance saves the class-attribute
+        # lookup and the explicit self argument on every dispatched node
 
     def add_dependency(self, depend_module):
         """
@@ -155,26 +183,38 @@ class ImportVisitor(ast.NodeVisitor):
         ----------
         depend_module: the module to be added
         """
-        self.depgraph.setdefault(self.cur_module_name, set()).add(depend_module)
+        # a list, not a set: every record is unique anyway (one per class),
+        # so hashing the long label strings on insert would be pure overhead
+        self.depgraph.setdefault(self.cur_module_name, []).append(depend_module)
 
     def visit(self, node):
         """
         This function visits the node is in the packages and extract the relevant information
-        (i.e. classes, functions, variables, relations between them)
+        (i.e. classes, functions, variables, relations between them).
+        Only ImportFrom, ClassDef and Attribute nodes carry information we need,
+        so dispatch is a single type() lookup instead of isinstance chains.
         Parameters
         ----------
         node: current node
         """
-        if isinstance(node, _ast.ImportFrom):
-            # AST definition:
-            #     ImportFrom(identifier? module, alias* names, int? level)
-            #     Gets import relation
-            self.import_info(node)
-
-        if isinstance(node, ast.ClassDef):
-            self.class_info(node)
-        elif isinstance(node, ast.Attribute):
-            self.attribute_info(node)
+        handler = self._handlers.get(type(node))
+        if handler is not None:
+            # handlers continue the traversal themselves, so class_info can
+            # collect from its subtree before building the class label
+            handler(node)
+        else:
+            self.generic_visit(node)
+
+    def generic_visit(self, node):
+        """
+        Visits all child nodes directly, skipping the visit_* name lookup
+        of the base class.
+        Parameters
+        ----------
+        node: current node
+        """
+        for child in ast.iter_child_nodes(node):
+            self.visit(child)
 
     def import_info(self, node):
         """
@@ -186,18 +226,15 @@ class ImportVisitor(ast.NodeVisitor):
         node: _ast.ImportFrom node we want the information from
 
         """
-        for (fieldname, value) in ast.iter_fields(node):
-            if fieldname == 'names':
-                if value[0].name.startswith('Q') or value[0].name.islower() or value[0].name.isupper() or value[0].name == '*':
-                    continue
-                vlist = []
-
-                # if the import is relevant add it to vlist
-                if self.counter in self.import_relation:
-                    vlist = self.import_relation[self.counter]
-                if (value[0].name not in vlist):
-                    vlist.append(value[0].name)
-                    self.import_relation[self.counter] = vlist
+        # node.names is a plain field of ImportFrom, so read it directly
+        # instead of searching for it through ast.iter_fields
+        if node.names:
+            name = node.names[0].name
+            if not _SKIP_IMPORT(name):
+                # if the import is relevant record it; the set makes the
+                # membership check O(1) instead of a list scan
+                self.import_relation[self.counter].add(name)
+        self.generic_visit(node)
         return
 
     def class_info(self, node):
@@ -210,32 +247,44 @@ class ImportVisitor(ast.NodeVisitor):
         node: _ast.ClassDef node we want the information from
 
         """
-        atr_list = ''
-        atr_list = '"' + str(self.counter) + '" [label="{' + node.name + "| "
+        num = self.counter
+        self.num_to_class[node.name] = num
+        self.counter += 1
+        ids = [n.id for n in node.bases if hasattr(n, 'id')]
+
+        # keyed by the class number, so rendering an edge only needs one
+        # lookup for the base name instead of resolving both endpoints
+        for id in ids:
+            self.depgRelation[num] = id
+
+        # collect the _-prefixed attributes while the subtree is visited,
+        # instead of walking the whole class body a second time
+        self._init_attrs.append(set())
+        self.generic_visit(node)
+        attribute = self._init_attrs.pop()
+
+        # accumulate the label in a list and join once, instead of quadratic
+        # string concatenation for classes with many methods/attributes
+        label = ['[label="{', node.name, '| ']
 
         methods = [n.name for n in node.body if isinstance(n, ast.FunctionDef)]
         for method in methods:
             if method == "__init__":
-                attribute = {n.attr for n in ast.walk(node) if (
-                        isinstance(n, ast.Attribute) and n.attr.startswith("_") and not n.attr.startswith("__"))}
                 for a in attribute:
-                    atr_list = atr_list + a + '\l'
-                atr_list = atr_list + '| '
+                    label.append(a)
+                    label.append('\l')
+                label.append('| ')
                 continue
             elif method.startswith("__"):
                 continue
-            atr_list = atr_list + method + '()\l'
+            label.append(method)
+            label.append('()\l')
 
-        atr_list = atr_list + '}", shape="record"]'
+        label.append('}", shape="record"]')
 
-        self.num_to_class[node.name] = self.counter
-        self.add_dependency(atr_list)
-        self.verb_list[self.counter] = []
-        self.counter += 1
-        ids = [n.id for n in node.bases if hasattr(n, 'id')]
-
-        for id in ids:
-            self.depgRelation[node.name] = id
+        # the record carries its own local number so duplicate class names
+        # within a file cannot scramble the numbering downstream
+        self.add_dependency((num, node.name, ''.join(label)))
         return
 
     def attribute_info(self, node):
@@ -247,15 +296,225 @@ class ImportVisitor(ast.NodeVisitor):
         node: _ast.Attribute node we want the information from
 
         """
-        v_list = []
+        self.verb_list[self.counter - 1].add(node.attr)
+        if self._init_attrs and node.attr.startswith("_") and not node.attr.startswith("__"):
+            self._init_attrs[-1].add(node.attr)
+        self.generic_visit(node)
+        return
 
-        if (self.counter - 1) in self.verb_list:
-            v_list = self.verb_list[self.counter - 1]
+    # AST definition:
+    #     ImportFrom(identifier? module, alias* names, int? level)
+    #     Gets import relation
+    _DISPATCH = {
+        ast.ImportFrom: import_info,
+        ast.ClassDef: class_info,
+        ast.Attribute: attribute_info,
+    }
 
-        if (node.attr not in v_list):
-            v_list.append(node.attr)
-            self.verb_list[self.counter - 1] = v_list
-        return
+def _iter_py_files(root):
+    """
+    Yields every .py file under root recursively.
+    Uses os.scandir so the directory/file checks come from the DirEntry
+    cache instead of costing an extra stat call per entry.
+
+    Parameters
+    ----------
+    root: Directory to scan
+
+    Returns
+    -------
+    Generator of .py file paths
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.py'):
+                    yield entry.path
+
+def _init_worker(ast_cache):
+    """
+    Pool initializer giving every worker process a read-only view of the AST cache.
+
+    Parameters
+    ----------
+    ast_cache: Dictionary mapping source hash to the extracted file summary
+    """
+    global _ast_cache
+    _ast_cache = ast_cache
+
+def _load_ast_cache():
+    """
+    Loads the persistent AST cache from disk.
+
+    Returns
+    -------
+    Dictionary mapping source hash to the extracted file summary,
+    empty if there is no usable cache yet
+    """
+    try:
+        with open(_CACHE_FILE, 'rb') as fh:
+            version, entries = pickle.load(fh)
+    except (OSError, pickle.PickleError, EOFError, TypeError, ValueError):
+        return {}
+    if version != _CACHE_VERSION:
+        return {}
+    return entries
+
+def _save_ast_cache(ast_cache):
+    """
+    Writes the AST cache back to disk atomically.
+
+    Parameters
+    ----------
+    ast_cache: Dictionary mapping source hash to the extracted file summary
+    """
+    os.makedirs(_CACHE_DIR, exist_ok=True)
+    tmp_file = _CACHE_FILE + '.tmp'
+    with open(tmp_file, 'wb') as fh:
+        pickle.dump((_CACHE_VERSION, ast_cache), fh, pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_file, _CACHE_FILE)
+
+def _parse_file(path, module_name, package_name):
+    """
+    Reads and parses a single .py file and extracts its UML information.
+    Runs in a worker process, so everything returned is plain picklable data.
+
+    Parameters
+    ----------
+    path: Path of the .py file to parse
+    module_name: Dotted module name of the file
+    package_name: The current package
+
+    Returns
+    -------
+    Tuple of (module_name, source hash, class records in definition order,
+    relations between classes, import relations keyed by local class number)
+    """
+    with open(path, 'rb') as fh:
+        src = fh.read()
+    return _parse_source(src, path, module_name, package_name)
+
+def _parse_source(src, path, module_name, package_name):
+    """
+    Extracts the UML information from the raw bytes of a .py file.
+    Class numbering is local to the file; the caller assigns the global numbers.
+    If the source hash is already in the AST cache, the parse is skipped
+    entirely and the cached summary is returned.
+
+    Parameters
+    ----------
+    src: Raw bytes of the file
+    path: Path of the .py file the bytes came from
+    module_name: Dotted module name of the file
+    package_name: The current package
+
+    Returns
+    -------
+    Tuple of (module_name, source hash, class records in definition order,
+    relations between classes, import relations keyed by local class number)
+    """
+    key = xxhash.xxh3_64(src).hexdigest()
+
+    cached = _ast_cache.get(key)
+    if cached is not None:
+        return (module_name, key) + cached
+
+    # cheap literal screen: a file can only contribute classes or import
+    # relations if it contains these substrings, so skip ast.parse when it
+    # has neither (false positives just fall through to the normal parse)
+    if b'class ' not in src and b'from ' not in src:
+        return (module_name, key, [], {}, {})
+
+    import_visitor = ImportVisitor(package_name)
+    import_visitor.cur_module_name = module_name
+    # compile() with PyCF_ONLY_AST is what ast.parse does underneath, minus
+    # the wrapper; dont_inherit keeps __future__ flags of this module from
+    # leaking into the parse and type_comments stay off by default
+    ast_tree = compile(src, path, 'exec', flags=ast.PyCF_ONLY_AST, dont_inherit=True, optimize=0)
+    import_visitor.visit(ast_tree)
+
+    records = import_visitor.depgraph.get(module_name, [])
+    # each record starts with its local number, so plain sorting restores
+    # definition order even when nested classes completed out of order
+    class_records = sorted(records)
+
+    return (module_name, key, class_records, import_visitor.depgRelation, import_visitor.import_relation)
+
+def _read_files(paths, module_names, out_queue):
+    """
+    Reader thread body: streams (path, module_name, bytes) items into the
+    bounded queue, then sends None when every file has been read, or the
+    raised exception if a read fails (broken symlink, deleted file, ...)
+    so the consumer never waits on a sentinel that will not arrive.
+
+    Parameters
+    ----------
+    paths: Paths of the .py files to read
+    module_names: Dotted module name of each file
+    out_queue: Queue the read files are pushed into
+    """
+    try:
+        for path, module_name in zip(paths, module_names):
+            with open(path, 'rb') as fh:
+                out_queue.put((path, module_name, fh.read()))
+    except BaseException as exc:
+        out_queue.put(exc)
+    else:
+        out_queue.put(None)
+
+def _parse_files_serial(paths, module_names, package_name):
+    """
+    Parses the files in this process, overlapping the disk reads with the
+    parsing: a reader thread fills a bounded queue with file contents while
+    the main thread runs ast over them. Used when the tree is too small for
+    worker processes to pay for their startup cost.
+
+    Parameters
+    ----------
+    paths: Paths of the .py files to parse
+    module_names: Dotted module name of each file
+    package_name: The current package
+
+    Returns
+    -------
+    List of per-file summaries as produced by _parse_source
+    """
+    file_queue = queue.Queue(maxsize=32)
+    # daemon so a failing consumer can never leave the interpreter hanging
+    # on a reader that is blocked in put() against the bounded queue
+    reader = threading.Thread(target=_read_files, args=(paths, module_names, file_queue), daemon=True)
+    reader.start()
+
+    results = []
+    reader_done = False
+    try:
+        while True:
+            item = file_queue.get()
+            if item is None:
+                reader_done = True
+                break
+            if isinstance(item, BaseException):
+                # the reader died on this error; surface it here
+                reader_done = True
+                raise item
+            path, module_name, src = item
+            results.append(_parse_source(src, path, module_name, package_name))
+    except BaseException:
+        # unblock the reader before propagating (e.g. a SyntaxError in one
+        # of the files) so the thread can run to completion; if the reader
+        # already sent its terminal item there is nothing left to drain
+        if not reader_done:
+            while True:
+                item = file_queue.get()
+                if item is None or isinstance(item, BaseException):
+                    break
+        raise
+
+    reader.join()
+    return results
 
 def set_up_files(output_path= "documentation/UML"):
     """
@@ -268,17 +527,16 @@ def set_up_files(output_path= "documentation/UML"):
     -------
     The path location of the UML diagram (.dot file)
     """
-    if not os.path.exists(output_path):
+    if not os.path.exists(output_path) and not os.path.isabs(output_path):
         p_sys = sys.path[0].split('documentation')[0]
         output_path = os.path.join(p_sys, output_path)
-        if not os.path.exists(output_path):
-            os.mkdir(output_path)
+    os.makedirs(output_path, exist_ok=True)
 
     file_loc= os.path.join(output_path, 'classes_blyzer.dot')
 
     return file_loc
 
-def UML_generator(package_path= 'blyzer', output_path="documentation/UML"):
+def UML_generator(package_path= 'blyzer', output_path="documentation/UML", keep_dot=False):
     """
     This function generates a UML diagram for the blyzer project.
     By default the project is 'blyzer' and the UMLs are saved in 'documentation/UML'.
@@ -287,33 +545,80 @@ def UML_generator(package_path= 'blyzer', output_path="documentation/UML"):
     ----------
     package_path: Name of the project you wish to generate UML for.
     ouput_path: Location of saved UML
+    keep_dot: Keep the intermediate .dot file next to the .png
     """
 
     output_path = set_up_files(output_path)
 
     (_, package_name) = os.path.split(package_path)
-    import_visitor = ImportVisitor(package_name)
-    # Analyze all the .py files under this directory 'path'
-    path_prefix_len = len(os.path.split(package_path)[0])
-    for root, _, files in os.walk(package_path):
-        module_prefix = ".".join(root[path_prefix_len + 1:].split('/'))
-        for pyfile in files:
-            if pyfile.endswith(".py"):
-                module_name = ".".join([module_prefix, os.path.splitext(pyfile)[0]])
-                import_visitor.cur_module_name = module_name
-                ast_tree = ast.parse(open(os.path.join(root, pyfile), encoding='utf-8').read())
-
-                for node in ast.walk(ast_tree):
-                    import_visitor.visit(node)
-
-    # Generates the UML diagram as .dot file
+    # Collect all the .py files under this directory 'path'
+    parent = os.path.split(package_path)[0] or '.'
+    paths = []
+    module_names = []
+    for path in _iter_py_files(package_path):
+        paths.append(path)
+        # _iter_py_files already guarantees the '.py' suffix, so slicing it
+        # off is enough — no need for a splitext round-trip
+        module_names.append(os.path.relpath(path, parent)[:-3].replace(os.sep, '.'))
+
+    # Parsing is CPU-bound and independent per file, so farm it out to worker
+    # processes; for small trees where the pool startup would dominate, parse
+    # in-process with a reader thread overlapping the disk reads instead.
+    # Either way files whose source hash is already in the cache skip ast.
+    ast_cache = _load_ast_cache()
+    max_workers = os.cpu_count() or 1
+    if max_workers == 1 or len(paths) <= 4 * max_workers:
+        _init_worker(ast_cache)
+        results = _parse_files_serial(paths, module_names, package_name)
+    else:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers,
+                                                    initializer=_init_worker,
+                                                    initargs=(ast_cache,)) as executor:
+            results = list(executor.map(_parse_file, paths, module_names, [package_name] * len(paths)))
+
+    # Merge the per-file results, assigning the global class numbers in module order
+    # so the numbering is deterministic regardless of worker scheduling
+    depgraph = {}
+    num_to_class = {}
+    depgRelation = {}
+    import_relation = {}
+    counter = 0
+    new_cache = {}
+    for module_name, key, class_records, relations, imports in sorted(results, key=lambda res: res[0]):
+        offset = counter
+        new_cache[key] = (class_records, relations, imports)
+        # the records carry their assigned number into the output, so
+        # classes sharing a name keep distinct nodes; offsetting the local
+        # number keeps records, relations and imports consistently aligned
+        # (num_to_class keeps the last number per name for name-based edge
+        # lookups, as before)
+        numbered_records = []
+        for (local_num, name, label) in class_records:
+            num_to_class[name] = offset + local_num
+            numbered_records.append((offset + local_num, label))
+        counter = offset + len(class_records)
+        depgraph[module_name] = numbered_records
+        for local_num, base_name in relations.items():
+            depgRelation[offset + local_num] = base_name
+        # a module with imports but no (or trailing) classes records them
+        # under a local key equal to its class count, which lands on the
+        # next module's first number — merge instead of overwriting
+        for local_num, imported in imports.items():
+            import_relation.setdefault(offset + local_num, set()).update(imported)
+
+    # Rebuilding the cache from this run's results also evicts entries for
+    # files that no longer exist, so the cache stays bounded
+    _save_ast_cache(new_cache)
+
+    # Generates the UML diagram as DOT source
     dot_generator = DependencyDotGenerator()
-    dot_generator.render(import_visitor.depgraph, import_visitor.num_to_class, import_visitor.depgRelation, import_visitor.import_relation, output_path)
+    dot_source = dot_generator.render(depgraph, num_to_class, depgRelation, import_relation,
+                                      output_path if keep_dot else None)
 
-    # Converts the .dot file to .png file
-    (graph,) = pydot.graph_from_dot_file(output_path)
-    graph.write_png(output_path.replace('.dot', '.png'))
-    os.remove(output_path)
+    # Converts the DOT source to a .png file by piping it straight to
+    # Graphviz, without re-parsing the text we just produced
+    subprocess.run(['dot', '-Tpng', '-o', output_path.replace('.dot', '.png')],
+                   input=dot_source.encode('utf-8'), check=True)
 
 
 def main():
@@ -325,14 +630,15 @@ def main():
     parser = argparse.ArgumentParser(description='Build module dependency graph for a package.')
     parser.add_argument('-p', '--path', nargs='?', type=str, help='path to the top level package we want to analyze')
     parser.add_argument('-o', '--out',  nargs='?', type=str, help='output path, if missing, output is written to documentation/UML')
+    parser.add_argument('--keep-dot', action='store_true', help='keep the intermediate .dot file next to the .png')
     args = parser.parse_args()
 
     if (args.path is None) and (args.out is None):
-        UML_generator()
+        UML_generator(keep_dot=args.keep_dot)
     elif args.out is None:
-        UML_generator(args.path)
+        UML_generator(args.path, keep_dot=args.keep_dot)
     else:
-        UML_generator(args.path, args.out)
+        UML_generator(args.path, args.out, keep_dot=args.keep_dot)
 
 if __name__ == '__main__':
     main()